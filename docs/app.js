@@ -2,19 +2,30 @@ document.addEventListener('DOMContentLoaded', () => {
     const API = {
         players: './data/player_id_map.json',
         scouting: './data/scouting_reports.json',
+        hitterReports: './data/hitter_reports',
+        matchups: './data/matchups',
+        teamReports: './data/team_reports.json',
         teamHistory: './data/team_history.json',
         playerInfo: './data/player_info.json',
         typeDefinitions: './data/type_definitions.json'
     };
 
+    // Hitter report and matchup chunks hold blocks of consecutive player IDs. Keep in
+    // sync with PLAYER_CHUNK_SIZE in scripts/matchup_index.py.
+    const PLAYER_CHUNK_SIZE = 100;
+
     const state = {
         players: {},
         scoutingReports: {},
+        hitterReportChunks: {},
+        matchupChunks: {},
+        teamReports: {},
         teamHistory: {},
         playerInfo: {},
         typeDefinitions: {},
         playerMap: new Map(),
         currentPlayerId: null,
+        currentTeam: null,
     };
 
     const elements = {
@@ -87,10 +98,13 @@ document.addEventListener('DOMContentLoaded', () => {
         
         elements.statsView.style.display = 'block';
 
-        if (state.currentPlayerId) {
+        if (state.currentTeam) {
+            displayTeamPage(state.currentTeam.franchiseKey, state.currentTeam.season);
+        } else if (state.currentPlayerId) {
             displayPlayerPage(state.currentPlayerId);
         } else {
-            elements.statsContentDisplay.innerHTML = '<p>Search for a player to see their scouting report.</p>';
+            elements.statsContentDisplay.innerHTML = '<p>Search for a player to see their scouting report, or pick a team to see its pitching staff.</p>';
+            displayTeamList(elements.statsContentDisplay);
         }
     };
 
@@ -154,10 +168,37 @@ document.addEventListener('DOMContentLoaded', () => {
                     elements.playerSuggestions.style.display = 'none';
                     displayPlayerPage(playerId);
                 }
+                return;
+            }
+
+            const teamLink = event.target.closest('.team-link');
+            if (teamLink) {
+                event.preventDefault();
+                window.location.hash = '#/teams';
+                elements.playerSearch.value = '';
+                displayTeamPage(teamLink.dataset.franchiseKey, teamLink.dataset.season);
             }
         });
     };
 
+    // Data files outside loadData are only fetched the first time a view needs them and
+    // cached by URL in state[stateKey]. A missing file (e.g. a block of player IDs with
+    // no chunk) resolves to null; a failed fetch is dropped so the next view retries.
+    const lazyLoad = (stateKey, url) => {
+        const cache = state[stateKey];
+        if (!cache[url]) {
+            cache[url] = fetch(url)
+                .then(res => res.ok ? res.json() : null)
+                .catch(error => {
+                    delete cache[url];
+                    throw error;
+                });
+        }
+        return cache[url];
+    };
+
+    const playerChunkUrl = (baseUrl, playerId, prefix = '') => `${baseUrl}/${prefix}${Math.floor(playerId / PLAYER_CHUNK_SIZE)}.json`;
+
     const createHistogramSection = (titleText, situationalHistograms, conditionalHistograms, seasonHistograms, chartLabelStyle, conditionalAfterDeltaHistograms) => {
         const section = document.createElement('div');
         section.className = 'scouting-section';
@@ -193,6 +234,16 @@ document.addEventListener('DOMContentLoaded', () => {
                 situationalTitleMap = {
                     'overall': 'All Pitch Deltas',
                 }
+            } else if (chartLabelStyle === 'swing') {
+                situationalTitleMap = {
+                    'overall': 'All Swings',
+                    'first_of_game': 'First Swing of Game',
+                    'risp': 'Swings with Runners in Scoring Position',
+                };
+            } else if (chartLabelStyle === 'swing-delta') {
+                situationalTitleMap = {
+                    'overall': 'All Swing Deltas',
+                };
             }
 
             for (const key in situationalHistograms) {
@@ -289,7 +340,7 @@ document.addEventListener('DOMContentLoaded', () => {
             chartContainer.className = 'chart-container';
     
             let chartLabels;
-            if (chartLabelStyle === 'delta') {
+            if (chartLabelStyle === 'delta' || chartLabelStyle === 'swing-delta') {
                 chartLabels = data.map(bin => bin.label);
             } else {
                 chartLabels = data.map(bin => {
@@ -337,10 +388,161 @@ document.addEventListener('DOMContentLoaded', () => {
         return section;
     }
 
+    const TENDENCY_NAMES = {
+        'repeat_percentage': 'Double Up Rate',
+        'has_tripled_up': 'Ever Tripled Up?',
+        'swing_match_rate': 'Previous Swing Rate',
+        'diff_match_rate': 'Previous Difference Rate',
+        'previous_pitch_rate': 'Previous Pitch Rate',
+        'meme_percentage': 'Meme Rate'
+    };
+
+    const formatTendencies = (tendencies) => Object.entries(tendencies).map(([key, value]) => [
+        typeof value === 'boolean' ? (value ? 'Yes' : 'No') : `${value}%`,
+        TENDENCY_NAMES[key] || key.replace(/_/g, ' ')
+    ]);
+
+    // Appends an info item to the container for each [value, label].
+    const appendInfoItems = (container, items) => {
+        items.forEach(([value, label]) => {
+            const item = document.createElement('div');
+            item.className = 'info-item';
+            const valueDiv = document.createElement('div');
+            valueDiv.className = 'info-item-value';
+            valueDiv.textContent = value;
+            const labelDiv = document.createElement('div');
+            labelDiv.className = 'info-item-label';
+            labelDiv.textContent = label;
+            item.appendChild(valueDiv);
+            item.appendChild(labelDiv);
+            container.appendChild(item);
+        });
+    };
+
+    // A titled row of info items, each given as [value, label].
+    const createItemsSection = (titleText, items) => {
+        const section = document.createElement('div');
+        section.className = 'scouting-section';
+        const title = document.createElement('h3');
+        title.textContent = titleText;
+        section.appendChild(title);
+
+        const container = document.createElement('div');
+        container.className = 'horizontal-items-container';
+        appendInfoItems(container, items);
+        section.appendChild(container);
+        return section;
+    };
+
+    const createBreakdownSection = (titleText, groups, groupNames, valueNames) => {
+        const section = document.createElement('div');
+        section.className = 'scouting-section';
+
+        const header = document.createElement('div');
+        header.className = 'scouting-section-header';
+
+        const title = document.createElement('h3');
+        title.textContent = titleText;
+        header.appendChild(title);
+
+        const controls = document.createElement('div');
+        controls.className = 'histogram-header-controls';
+
+        const nValueSpan = document.createElement('span');
+        nValueSpan.className = 'histogram-n-value';
+        controls.appendChild(nValueSpan);
+
+        const select = document.createElement('select');
+        select.className = 'histogram-select';
+
+        for (const [groupName, groupValues] of Object.entries(groups)) {
+            const group = document.createElement('optgroup');
+            group.label = groupNames[groupName] || groupName.replace(/_/g, ' ');
+            for (const value of Object.keys(groupValues)) {
+                const option = document.createElement('option');
+                option.value = `${groupName}|${value}`;
+                option.textContent = valueNames[value] || value.replace(/_/g, ' ');
+                group.appendChild(option);
+            }
+            select.appendChild(group);
+        }
+
+        controls.appendChild(select);
+        header.appendChild(controls);
+        section.appendChild(header);
+
+        const tendenciesContainer = document.createElement('div');
+        tendenciesContainer.className = 'horizontal-items-container';
+        section.appendChild(tendenciesContainer);
+
+        const chartWrapper = document.createElement('div');
+        chartWrapper.className = 'chart-wrapper';
+        section.appendChild(chartWrapper);
+
+        const renderBarChart = (labels, counts) => {
+            const chartContainer = document.createElement('div');
+            chartContainer.className = 'chart-container';
+            const canvas = document.createElement('canvas');
+            chartContainer.appendChild(canvas);
+            chartWrapper.appendChild(chartContainer);
+
+            new Chart(canvas, {
+                type: 'bar',
+                data: {
+                    labels: labels,
+                    datasets: [{
+                        label: 'Count',
+                        data: counts,
+                        backgroundColor: 'rgba(255, 69, 0, 0.6)',
+                        borderColor: 'rgba(255, 69, 0, 1)',
+                        borderWidth: 1
+                    }]
+                },
+                options: {
+                    scales: {
+                        y: { beginAtZero: true, ticks: { color: '#D7DADC' }, grid: { color: '#343536' } },
+                        x: { ticks: { color: '#D7DADC' }, grid: { display: false } }
+                    },
+                    plugins: { legend: { display: false } }
+                }
+            });
+        };
+
+        const renderBreakdown = (value) => {
+            const [groupName, key] = value.split('|');
+            const breakdown = groups[groupName][key];
+
+            nValueSpan.textContent = breakdown.games ? `N = ${breakdown.n} (${breakdown.games} games)` : `N = ${breakdown.n}`;
+
+            tendenciesContainer.innerHTML = '';
+            appendInfoItems(tendenciesContainer, formatTendencies(breakdown.tendencies));
+
+            chartWrapper.innerHTML = '';
+            renderBarChart(
+                breakdown.histogram.map(bin => {
+                    const lower_bound = parseInt(bin.label.split('-')[0], 10);
+                    if (lower_bound === 1) return '0s';
+                    return `${Math.floor(lower_bound / 100) * 100}s`;
+                }),
+                breakdown.histogram.map(bin => bin.count)
+            );
+            if (breakdown.delta_histogram) {
+                renderBarChart(breakdown.delta_histogram.map(bin => bin.label), breakdown.delta_histogram.map(bin => bin.count));
+            }
+        };
+
+        if (select.options.length > 0) {
+            renderBreakdown(select.value);
+        }
+        select.addEventListener('change', (event) => renderBreakdown(event.target.value));
+
+        return section;
+    };
+
     const displayScoutingReport = (playerId) => {
         const report = state.scoutingReports[playerId];
         if (!report) {
-            elements.statsContentDisplay.innerHTML += `<p>No scouting report available.</p>`;
+            elements.statsContentDisplay.innerHTML += `<p>No pitcher scouting report available.</p>`;
             return;
         }
         elements.statsContentDisplay.innerHTML += `<h3 class="section-title">Scouting Report</h3>`;
@@ -372,19 +574,7 @@ document.addEventListener('DOMContentLoaded', () => {
             if (pitches.length > 0) {
                 const container = document.createElement('div');
                 container.className = 'horizontal-items-container';
-                pitches.forEach(p => {
-                    const item = document.createElement('div');
-                    item.className = 'info-item';
-                    const valueDiv = document.createElement('div');
-                    valueDiv.className = 'info-item-value';
-                    valueDiv.textContent = p.pitch;
-                    const labelDiv = document.createElement('div');
-                    labelDiv.className = 'info-item-label';
-                    labelDiv.textContent = `${p.count}x`;
-                    item.appendChild(valueDiv);
-                    item.appendChild(labelDiv);
-                    container.appendChild(item);
-                });
+                appendInfoItems(container, pitches.map(p => [p.pitch, `${p.count}x`]));
                 section.appendChild(container);
             } else {
                 section.innerHTML += '<p>No pitch data available.</p>';
@@ -394,45 +584,33 @@ document.addEventListener('DOMContentLoaded', () => {
 
         // --- Tendencies ---
         if (report.tendencies) {
-            const section = document.createElement('div');
-            section.className = 'scouting-section';
-            const title = document.createElement('h3');
-            title.textContent = 'Tendencies';
-            section.appendChild(title);
+            leftColumn.appendChild(createItemsSection('Tendencies', formatTendencies(report.tendencies)));
+        }
 
-            const tendencyNameMap = {
-                'repeat_percentage': 'Double Up Rate',
-                'has_tripled_up': 'Ever Tripled Up?',
-                'swing_match_rate': 'Previous Swing Rate',
-                'diff_match_rate': 'Previous Difference Rate',
-                'meme_percentage': 'Meme Rate'
+        // --- Splits ---
+        if (report.splits && Object.keys(report.splits).length > 0) {
+            const splitGroupNames = {
+                'game_type': 'Game Type',
+                'venue': 'Home/Away',
+                'opponent': 'Opponent'
             };
+            const splitValueNames = {
+                'Regular': 'Regular Season',
+                'Playoff': 'Playoffs'
+            };
+            leftColumn.appendChild(createBreakdownSection('Splits', report.splits, splitGroupNames, splitValueNames));
+        }
 
-            const container = document.createElement('div');
-            container.className = 'horizontal-items-container';
-            for(const [key, value] of Object.entries(report.tendencies)){
-                const item = document.createElement('div');
-                item.className = 'info-item';
-                const valueDiv = document.createElement('div');
-                valueDiv.className = 'info-item-value';
-                
-                let displayValue;
-                if (typeof value === 'boolean') {
-                    displayValue = value ? 'Yes' : 'No';
-                } else {
-                    displayValue = `${value}%`;
-                }
-                valueDiv.textContent = displayValue;
-
-                const labelDiv = document.createElement('div');
-                labelDiv.className = 'info-item-label';
-                labelDiv.textContent = tendencyNameMap[key] || key.replace(/_/g, ' ');
-                item.appendChild(valueDiv);
-                item.appendChild(labelDiv);
-                container.appendChild(item);
-            }
-            section.appendChild(container);
-            leftColumn.appendChild(section);
+        // --- Recency Windows ---
+        if (report.recency_windows && Object.keys(report.recency_windows).length > 0) {
+            const windowNames = {
+                'last_5_games': 'Last 5 Games',
+                'last_10_games': 'Last 10 Games',
+                'last_25_games': 'Last 25 Games',
+                'last_100_pitches': 'Last 100 Pitches',
+                'current_season': 'Current Season'
+            };
+            leftColumn.appendChild(createBreakdownSection('Recent Form', { 'recent': report.recency_windows }, { 'recent': 'Window' }, windowNames));
         }
 
         // --- Recent Games Pitch Chart ---
@@ -608,6 +786,282 @@ document.addEventListener('DOMContentLoaded', () => {
         elements.statsContentDisplay.appendChild(mainGrid);
     };
 
+
+    const displayHitterReport = async (playerId, container) => {
+        let hitterReports;
+        try {
+            hitterReports = await lazyLoad('hitterReportChunks', playerChunkUrl(API.hitterReports, playerId));
+        } catch (error) {
+            console.error("Failed to load hitter reports:", error);
+            return;
+        }
+        const report = hitterReports ? hitterReports[playerId] : null;
+        if (!report || state.currentPlayerId !== playerId) return;
+
+        const sectionTitle = document.createElement('h3');
+        sectionTitle.className = 'section-title';
+        sectionTitle.textContent = 'Hitter Scouting Report';
+        container.appendChild(sectionTitle);
+
+        const mainGrid = document.createElement('div');
+        mainGrid.className = 'scouting-report-grid';
+
+        const leftColumn = document.createElement('div');
+        leftColumn.className = 'scouting-report-left';
+
+        const rightColumn = document.createElement('div');
+        rightColumn.className = 'scouting-report-right';
+        rightColumn.style.display = 'flex';
+        rightColumn.style.flexDirection = 'column';
+        rightColumn.style.gap = '20px';
+
+        // --- Favorite Swings ---
+        const swings = Object.entries(report.top_5_swings || {}).sort((a, b) => b[1] - a[1]);
+        if (swings.length > 0) {
+            leftColumn.appendChild(createItemsSection('Favorite Swings', swings.map(([swing, count]) => [swing, `${count}x`])));
+        }
+
+        // --- Tendencies ---
+        if (report.tendencies) {
+            leftColumn.appendChild(createItemsSection('Tendencies', formatTendencies(report.tendencies)));
+        }
+
+        // --- Recent Games Swing Chart ---
+        if (report.recent_games_info && report.recent_games_info.length > 0) {
+            const section = document.createElement('div');
+            section.className = 'scouting-section';
+
+            const header = document.createElement('div');
+            header.className = 'scouting-section-header';
+
+            const title = document.createElement('h3');
+            title.textContent = 'Recent Games - Swings';
+            header.appendChild(title);
+
+            const controls = document.createElement('div');
+            controls.className = 'histogram-header-controls';
+
+            const select = document.createElement('select');
+            select.className = 'histogram-select';
+            report.recent_games_info.forEach((game, index) => {
+                const option = document.createElement('option');
+                option.value = index;
+                option.textContent = `${game.season}.${game.session} vs ${game.opponent}`;
+                select.appendChild(option);
+            });
+            controls.appendChild(select);
+            header.appendChild(controls);
+            section.appendChild(header);
+
+            const swingChartContainer = document.createElement('div');
+            const swingCanvas = document.createElement('canvas');
+            swingChartContainer.appendChild(swingCanvas);
+            section.appendChild(swingChartContainer);
+
+            let swingChart;
+
+            const renderSwingChart = (gameIndex) => {
+                const game = report.recent_games_info[gameIndex];
+
+                if (swingChart) swingChart.destroy();
+                swingChart = new Chart(swingCanvas, {
+                    type: 'line',
+                    data: {
+                        labels: Array.from({ length: game.swings.length }, (_, i) => i + 1),
+                        datasets: [{
+                            label: 'Swing Number',
+                            data: game.swings,
+                            borderColor: '#FF4500',
+                            backgroundColor: 'rgba(255, 69, 0, 0.2)',
+                            fill: true,
+                            tension: 0.1
+                        }]
+                    },
+                    options: {
+                        scales: {
+                            y: { min: 0, max: 1000, ticks: { color: '#D7DADC' }, grid: { color: '#343536' } },
+                            x: { ticks: { color: '#D7DADC' }, grid: { color: '#343536' }, title: { display: true, text: 'Swing in Sequence' } }
+                        },
+                        plugins: { legend: { display: false } }
+                    }
+                });
+            };
+
+            renderSwingChart(0);
+            select.addEventListener('change', (e) => renderSwingChart(e.target.value));
+
+            leftColumn.appendChild(section);
+        }
+
+        // --- Results by Swing ---
+        if (report.results_by_swing && report.results_by_swing.length > 0) {
+            const section = document.createElement('div');
+            section.className = 'scouting-section';
+            const title = document.createElement('h3');
+            title.textContent = 'Results by Swing';
+            section.appendChild(title);
+
+            const resultTotals = {};
+            report.results_by_swing.forEach(bin => {
+                for (const [result, count] of Object.entries(bin.results)) {
+                    resultTotals[result] = (resultTotals[result] || 0) + count;
+                }
+            });
+            const resultNames = Object.keys(resultTotals).sort((a, b) => resultTotals[b] - resultTotals[a]);
+
+            const table = document.createElement('table');
+            table.className = 'stats-table';
+            let tableHTML = `<thead><tr><th>Swing</th>${resultNames.map(r => `<th>${r}</th>`).join('')}</tr></thead><tbody>`;
+            report.results_by_swing.forEach(bin => {
+                tableHTML += `<tr><td>${bin.label}</td>${resultNames.map(r => `<td>${bin.results[r] || 0}</td>`).join('')}</tr>`;
+            });
+            tableHTML += '</tbody>';
+            table.innerHTML = tableHTML;
+            section.appendChild(table);
+            leftColumn.appendChild(section);
+        }
+
+        // --- Histograms ---
+        if (report.histograms || report.conditional_histograms || report.season_histograms) {
+            rightColumn.appendChild(createHistogramSection('Swing Histograms', report.histograms, report.conditional_histograms, report.season_histograms, 'swing', null));
+        }
+        if (report.delta_histograms && Object.keys(report.delta_histograms).length > 0) {
+            rightColumn.appendChild(createHistogramSection('Swing Delta Histograms', report.delta_histograms, null, null, 'swing-delta', null));
+        }
+
+        mainGrid.appendChild(leftColumn);
+        mainGrid.appendChild(rightColumn);
+        container.appendChild(mainGrid);
+    };
+
+
+    const lowerBound = (values, target, lo, hi) => {
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (values[mid] < target) lo = mid + 1;
+            else hi = mid;
+        }
+        return lo;
+    };
+
+    const getMatchupHistory = (index, pair) => {
+        const history = [];
+        for (let k = index.pair_offsets[pair]; k < index.pair_offsets[pair + 1]; k++) {
+            history.push({
+                season: index.seasons[index.season[k]],
+                session: index.session[k],
+                pitch: index.pitch[k],
+                swing: index.swing[k],
+                diff: index.diff[k],
+                result: index.result[k] >= 0 ? index.results[index.result[k]] : ''
+            });
+        }
+        return history;
+    };
+
+    const displayMatchups = async (playerId, container) => {
+        let pitcherChunk, hitterChunk;
+        try {
+            [pitcherChunk, hitterChunk] = await Promise.all([
+                lazyLoad('matchupChunks', playerChunkUrl(API.matchups, playerId, 'pitchers_')),
+                lazyLoad('matchupChunks', playerChunkUrl(API.matchups, playerId, 'hitters_'))
+            ]);
+        } catch (error) {
+            console.error("Failed to load matchup index:", error);
+            return;
+        }
+        if (state.currentPlayerId !== playerId) return;
+
+        const chunks = { pitchers: pitcherChunk, hitters: hitterChunk };
+        const pairCount = (index, pair) => index.pair_offsets[pair + 1] - index.pair_offsets[pair];
+        const playerName = (id) => state.players[id] ? state.players[id].currentName : `#${id}`;
+
+        // The player's own range of pairs in a chunk: one binary search.
+        const findMatchups = (role) => {
+            const index = chunks[role];
+            const matchups = [];
+            if (!index) return matchups;
+            const i = lowerBound(index.player_ids, playerId, 0, index.player_ids.length);
+            if (i < index.player_ids.length && index.player_ids[i] === playerId) {
+                for (let pair = index.player_offsets[i]; pair < index.player_offsets[i + 1]; pair++) {
+                    matchups.push({ role, opponentId: index.opponent_ids[pair], pair, count: pairCount(index, pair) });
+                }
+            }
+            return matchups;
+        };
+        const pitchingTo = findMatchups('pitchers');
+        const battingAgainst = findMatchups('hitters');
+
+        if (pitchingTo.length === 0 && battingAgainst.length === 0) return;
+
+        const sectionTitle = document.createElement('h3');
+        sectionTitle.className = 'section-title';
+        sectionTitle.textContent = 'Head-to-Head';
+        container.appendChild(sectionTitle);
+
+        const section = document.createElement('div');
+        section.className = 'scouting-section';
+
+        const header = document.createElement('div');
+        header.className = 'scouting-section-header';
+
+        const title = document.createElement('h3');
+        title.textContent = 'Matchup History';
+        header.appendChild(title);
+
+        const controls = document.createElement('div');
+        controls.className = 'histogram-header-controls';
+
+        const nValueSpan = document.createElement('span');
+        nValueSpan.className = 'histogram-n-value';
+        controls.appendChild(nValueSpan);
+
+        const select = document.createElement('select');
+        select.className = 'histogram-select';
+
+        const addGroup = (label, matchups) => {
+            if (matchups.length === 0) return;
+            const group = document.createElement('optgroup');
+            group.label = label;
+            matchups
+                .sort((a, b) => b.count - a.count)
+                .forEach(matchup => {
+                    const option = document.createElement('option');
+                    option.value = `${matchup.role}|${matchup.pair}`;
+                    option.textContent = `${playerName(matchup.opponentId)} (${matchup.count})`;
+                    group.appendChild(option);
+                });
+            select.appendChild(group);
+        };
+        addGroup('Pitching To', pitchingTo);
+        addGroup('Batting Against', battingAgainst);
+
+        controls.appendChild(select);
+        header.appendChild(controls);
+        section.appendChild(header);
+
+        const table = document.createElement('table');
+        table.className = 'stats-table';
+        section.appendChild(table);
+
+        const renderMatchup = (value) => {
+            const [role, pair] = value.split('|');
+            const history = getMatchupHistory(chunks[role], parseInt(pair, 10));
+            nValueSpan.textContent = `N = ${history.length}`;
+            let tableHTML = '<thead><tr><th>Game</th><th>Pitch</th><th>Swing</th><th>Diff</th><th>Result</th></tr></thead><tbody>';
+            history.forEach(play => {
+                tableHTML += `<tr><td>${play.season}.${play.session}</td><td>${play.pitch ?? ''}</td><td>${play.swing ?? ''}</td><td>${play.diff ?? ''}</td><td>${play.result}</td></tr>`;
+            });
+            tableHTML += '</tbody>';
+            table.innerHTML = tableHTML;
+        };
+
+        renderMatchup(select.value);
+        select.addEventListener('change', (e) => renderMatchup(e.target.value));
+
+        container.appendChild(section);
+    };
+
     const handlePlayerSearch = (event) => {
         const query = event.target.value.toLowerCase();
         elements.playerSuggestions.innerHTML = '';
@@ -670,8 +1124,144 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     };
 
+    const sortSeasons = (seasons) => seasons.sort((a, b) => parseInt(a.slice(1)) - parseInt(b.slice(1)));
+
+    const displayTeamList = async (container) => {
+        let teamReports;
+        try {
+            teamReports = await lazyLoad('teamReports', API.teamReports);
+        } catch (error) {
+            console.error("Failed to load team reports:", error);
+            return;
+        }
+        if (!teamReports || state.currentPlayerId || state.currentTeam) return;
+
+        const seasons = sortSeasons([...new Set(Object.values(teamReports).flatMap(reports => Object.keys(reports)))]);
+        const latestSeason = seasons[seasons.length - 1];
+        if (!latestSeason) return;
+
+        const grid = document.createElement('div');
+        grid.className = 'team-list-grid';
+        Object.keys(teamReports)
+            .filter(franchiseKey => teamReports[franchiseKey][latestSeason])
+            .sort()
+            .forEach(franchiseKey => {
+                const teamInfo = getTeamInfoBySeason(franchiseKey, latestSeason);
+                const logoUrl = getTeamLogoBySeason(franchiseKey, latestSeason);
+                const item = document.createElement('a');
+                item.href = '#/teams';
+                item.className = 'team-list-item team-link';
+                item.dataset.franchiseKey = franchiseKey;
+                item.dataset.season = latestSeason;
+                item.innerHTML = `${logoUrl ? `<img src="${logoUrl}" class="team-list-logo">` : ''}<span class="team-list-name">${teamInfo ? teamInfo.name : franchiseKey}</span>`;
+                grid.appendChild(item);
+            });
+        container.appendChild(grid);
+    };
+
+    const displayTeamPage = async (franchiseKey, season) => {
+        state.currentPlayerId = null;
+        state.currentTeam = { franchiseKey, season };
+        elements.statsContentDisplay.innerHTML = '';
+
+        let teamReports;
+        try {
+            teamReports = await lazyLoad('teamReports', API.teamReports);
+        } catch (error) {
+            console.error("Failed to load team reports:", error);
+            elements.statsContentDisplay.innerHTML = '<p>Failed to load team reports.</p>';
+            return;
+        }
+        if (!state.currentTeam || state.currentTeam.franchiseKey !== franchiseKey || state.currentTeam.season !== season) return;
+
+        const reports = teamReports ? teamReports[franchiseKey] : null;
+        const report = reports ? reports[season] : null;
+        if (!report) {
+            elements.statsContentDisplay.innerHTML = '<p>No pitching staff report available.</p>';
+            return;
+        }
+
+        // --- Header with season navigation ---
+        const teamInfo = getTeamInfoBySeason(franchiseKey, season);
+        const teamName = teamInfo ? teamInfo.name : report.team;
+        const logoUrl = getTeamLogoBySeason(franchiseKey, season);
+        const seasons = sortSeasons(Object.keys(reports));
+        const seasonIndex = seasons.indexOf(season);
+        const seasonLink = (otherSeason, text) => `<a href="#/teams" class="season-nav-button team-link" data-franchise-key="${franchiseKey}" data-season="${otherSeason}">${text}</a>`;
+
+        let headerHTML = `<div class="team-stats-header"><h2 class="section-title">${logoUrl ? `<img src="${logoUrl}" class="player-team-logo"> ` : ''}${teamName} Pitching Staff, Season ${season.slice(1)}</h2><div class="season-nav-buttons">`;
+        if (seasonIndex > 0) headerHTML += seasonLink(seasons[seasonIndex - 1], `&larr; Season ${seasons[seasonIndex - 1].slice(1)}`);
+        if (seasonIndex < seasons.length - 1) headerHTML += seasonLink(seasons[seasonIndex + 1], `Season ${seasons[seasonIndex + 1].slice(1)} &rarr;`);
+        headerHTML += '</div></div>';
+        elements.statsContentDisplay.innerHTML = headerHTML;
+
+        const mainGrid = document.createElement('div');
+        mainGrid.className = 'scouting-report-grid';
+
+        const leftColumn = document.createElement('div');
+        leftColumn.className = 'scouting-report-left';
+
+        const rightColumn = document.createElement('div');
+        rightColumn.className = 'scouting-report-right';
+        rightColumn.style.display = 'flex';
+        rightColumn.style.flexDirection = 'column';
+        rightColumn.style.gap = '20px';
+
+        // --- Bullpen Usage ---
+        leftColumn.appendChild(createItemsSection('Bullpen Usage', [
+            [report.bullpen.games, 'Games'],
+            [report.bullpen.pitchers_used, 'Pitchers Used'],
+            [report.bullpen.pitchers_per_game, 'Pitchers per Game'],
+            [`${report.bullpen.starter_pitch_share}%`, 'Pitches by Starters'],
+        ]));
+
+        // --- Favorite Pitches ---
+        const pitches = Object.entries(report.top_5_pitches || {}).sort((a, b) => b[1] - a[1]);
+        if (pitches.length > 0) {
+            leftColumn.appendChild(createItemsSection('Favorite Pitches', pitches.map(([pitch, count]) => [pitch, `${count}x`])));
+        }
+
+        // --- Tendencies ---
+        if (report.tendencies) {
+            leftColumn.appendChild(createItemsSection('Tendencies', formatTendencies(report.tendencies)));
+        }
+
+        // --- Pitchers ---
+        if (report.pitchers && report.pitchers.length > 0) {
+            const section = document.createElement('div');
+            section.className = 'scouting-section';
+            const title = document.createElement('h3');
+            title.textContent = 'Pitchers';
+            section.appendChild(title);
+
+            const table = document.createElement('table');
+            table.className = 'stats-table';
+            let tableHTML = '<thead><tr><th>Pitcher</th><th>Pitches</th><th>Share</th><th>Games</th><th>Starts</th></tr></thead><tbody>';
+            report.pitchers.forEach(pitcher => {
+                const name = state.players[pitcher.id]
+                    ? `<a href="#/scouting" class="player-link" data-player-id="${pitcher.id}">${state.players[pitcher.id].currentName}</a>`
+                    : `#${pitcher.id}`;
+                const share = report.n > 0 ? (pitcher.pitches / report.n * 100).toFixed(1) : '0.0';
+                tableHTML += `<tr><td>${name}</td><td>${pitcher.pitches}</td><td>${share}%</td><td>${pitcher.games}</td><td>${pitcher.starts}</td></tr>`;
+            });
+            tableHTML += '</tbody>';
+            table.innerHTML = tableHTML;
+            section.appendChild(table);
+            leftColumn.appendChild(section);
+        }
+
+        // --- Histograms ---
+        rightColumn.appendChild(createHistogramSection('Staff Pitch Histograms', { overall: report.histogram }, null, null, 'pitch', null));
+        rightColumn.appendChild(createHistogramSection('Staff Pitch Delta Histograms', { overall: report.delta_histogram }, null, null, 'delta', null));
+
+        mainGrid.appendChild(leftColumn);
+        mainGrid.appendChild(rightColumn);
+        elements.statsContentDisplay.appendChild(mainGrid);
+    };
+
     const displayPlayerPage = (playerId) => {
         state.currentPlayerId = playerId;
+        state.currentTeam = null;
         elements.statsContentDisplay.innerHTML = '';
         const player = state.players[playerId];
         if (!player) return;
@@ -692,7 +1282,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const franchiseKey = getFranchiseKeyFromAbbr(mostRecentTeam, mostRecentSeason);
             const logoUrl = getTeamLogoBySeason(franchiseKey, mostRecentSeason);
             if (logoUrl) {
-                titleHTML = `<h2 class="section-title"><img src="${logoUrl}" class="player-team-logo"> ${playerName}</h2>`;
+                titleHTML = `<h2 class="section-title"><a href="#/teams" class="team-link" data-franchise-key="${franchiseKey}" data-season="${mostRecentSeason}"><img src="${logoUrl}" class="player-team-logo"></a> ${playerName}</h2>`;
             }
         }
 
@@ -728,6 +1318,13 @@ document.addEventListener('DOMContentLoaded', () => {
         elements.statsContentDisplay.innerHTML = titleHTML;
 
         displayScoutingReport(playerId);
+
+        const hitterReportContainer = document.createElement('div');
+        const matchupContainer = document.createElement('div');
+        elements.statsContentDisplay.appendChild(hitterReportContainer);
+        elements.statsContentDisplay.appendChild(matchupContainer);
+        displayHitterReport(playerId, hitterReportContainer);
+        displayMatchups(playerId, matchupContainer);
     };
 
     const getFranchiseKeyFromAbbr = (abbr, season) => {
@@ -741,7 +1338,7 @@ document.addEventListener('DOMContentLoaded', () => {
         return abbr; 
     };
 
-    const getTeamLogoBySeason = (franchiseKey, season) => {
+    const getTeamInfoBySeason = (franchiseKey, season) => {
         if (!franchiseKey || !season) return null;
         const seasonNum = parseInt(season.slice(1));
         if (isNaN(seasonNum)) return null;
@@ -749,7 +1346,11 @@ document.addEventListener('DOMContentLoaded', () => {
         const franchise = state.teamHistory[franchiseKey];
         if (!franchise) return null;
 
-        const teamInfo = franchise.find(t => seasonNum >= t.start && seasonNum <= t.end);
+        return franchise.find(t => seasonNum >= t.start && seasonNum <= t.end) || null;
+    };
+
+    const getTeamLogoBySeason = (franchiseKey, season) => {
+        const teamInfo = getTeamInfoBySeason(franchiseKey, season);
         if (!teamInfo) return null;
 
         const isLightMode = document.documentElement.classList.contains('light-mode');
@@ -0,0 +1,548 @@
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+
+PITCH_BIN_SIZE = 100
+NUM_PITCH_BINS = (1000 + PITCH_BIN_SIZE - 1) // PITCH_BIN_SIZE
+MEME_NUMBERS = [69, 420, 666, 327, 880]
+# Steal attempts: the 'Hitter' is the runner, so no batter comes to the plate. Older
+# seasons only record 'SB'/'CS' in 'Old Result'.
+STEAL_PATTERN = r'STEAL|^SB$|^CS\b|^CMS\b'
+DELTA_LABELS = ["0-50", "51-100", "101-150", "151-200", "201-250", "251-300", "301-350", "351-400", "401-450", "451-500"]
+
+# Extra group keys for split reports, mapped to the column holding the split value.
+# Add e.g. 'opponent': 'Batter Team' to also split by opposing team.
+REPORT_SPLITS = {
+    'game_type': 'GameType',
+    'venue': 'Venue',
+}
+
+# Recency windows: (kind, size). 'games' and 'pitches' take the pitcher's last `size`
+# games or pitches, 'season' takes everything in the current season.
+RECENCY_WINDOWS = {
+    'last_5_games': ('games', 5),
+    'last_10_games': ('games', 10),
+    'last_25_games': ('games', 25),
+    'last_100_pitches': ('pitches', 100),
+    'current_season': ('season', None),
+}
+
+def _number_bins(numbers):
+    """Bins pitch/swing numbers like _get_pitch_histogram_data (1000 counts as 0). Missing numbers get -1."""
+    return (numbers.where(numbers != 1000, 0) // PITCH_BIN_SIZE).fillna(-1).astype(int)
+
+def _delta_bins(numbers, previous_numbers):
+    """Bins circular deltas like _get_pitch_delta_histogram_data. Missing deltas get -1."""
+    delta = (numbers - previous_numbers).abs()
+    delta = delta.where(delta <= 500, 1000 - delta)
+    return np.maximum(np.ceil(delta / 50) - 1, 0).fillna(-1).astype(int)
+
+def _run_starts(*columns):
+    """Marks rows where any of the (sorted) key columns changes from the previous row."""
+    starts = np.zeros(len(columns[0]), dtype=bool)
+    if len(starts) == 0: return starts
+    starts[0] = True
+    for column in columns:
+        starts[1:] |= column[1:] != column[:-1]
+    return starts
+
+def prepare_pitch_columns(combined_df):
+    """
+    Builds the typed columns shared by the batch aggregations.
+
+    Rows without a pitcher are dropped and the rest are sorted once by pitcher and
+    gamelog order (season, session, game, then position in the gamelog), so every
+    grouped kernel below can work on contiguous runs of rows and a row's previous row
+    is the pitcher's previous pitch, extra innings included.
+    """
+    df = pd.DataFrame({
+        'Pitcher ID': pd.to_numeric(combined_df['Pitcher ID'], errors='coerce'),
+        'Hitter ID': pd.to_numeric(combined_df['Hitter ID'], errors='coerce'),
+        'Season': combined_df['Season'],
+        'Session': pd.to_numeric(combined_df['Session'], errors='coerce'),
+        'Game ID': combined_df['Game ID'],
+        'Inning': combined_df['Inning'],
+        'Pitch': pd.to_numeric(combined_df['Pitch'], errors='coerce'),
+        'Swing': pd.to_numeric(combined_df['Swing'], errors='coerce'),
+        'Diff': pd.to_numeric(combined_df['Diff'], errors='coerce'),
+        'OBC': pd.to_numeric(combined_df['OBC'], errors='coerce').fillna(0),
+        # S2 and S3 have no 'Exact Result', only 'Old Result'.
+        'Exact Result': combined_df['Exact Result'].fillna(combined_df['Old Result']).str.upper(),
+        'GameType': combined_df['GameType'],
+        'Batter Team': combined_df['Batter Team'],
+        'Pitcher Team': combined_df['Pitcher Team'],
+        'row': np.arange(len(combined_df)),
+    })
+    df = df[df['Pitcher ID'].notna()]
+    df['Pitcher ID'] = df['Pitcher ID'].astype(int)
+    df['Season_num'] = df['Season'].str.replace('S', '').astype(int)
+    # The home team pitches the top of each inning.
+    df['Venue'] = np.where(df['Inning'].astype(str).str.startswith('T'), 'Home', 'Away')
+    df['pitch_bin'] = _number_bins(df['Pitch'])
+    df.sort_values(by=['Pitcher ID', 'Season_num', 'Session', 'Game ID', 'row'], kind='stable', inplace=True)
+    df.reset_index(drop=True, inplace=True)
+
+    # Delta from the previous pitch of the same game.
+    pitch_norm = df['Pitch'].where(df['Pitch'] != 1000, 0)
+    previous_pitch = pitch_norm.groupby([df['Pitcher ID'], df['Season'], df['Game ID']], sort=False).shift(1)
+    df['delta_bin'] = _delta_bins(pitch_norm, previous_pitch)
+    return df
+
+def prepare_swing_columns(pitch_df):
+    """
+    Re-sorts the typed columns from prepare_pitch_columns by hitter and game order.
+
+    Steal attempts are dropped, since their 'Swing' is the runner's number. Within a
+    game rows keep their gamelog order, so the previous row is the hitter's previous
+    plate appearance.
+    """
+    is_steal = pitch_df['Exact Result'].str.contains(STEAL_PATTERN, na=False)
+    df = pitch_df[pitch_df['Hitter ID'].notna() & ~is_steal].copy()
+    df['Hitter ID'] = df['Hitter ID'].astype(int)
+    df.sort_values(by=['Hitter ID', 'Season_num', 'Session', 'Game ID', 'row'], kind='stable', inplace=True)
+    df.reset_index(drop=True, inplace=True)
+
+    swing_norm = df['Swing'].where(df['Swing'] != 1000, 0)
+    game = [df['Hitter ID'], df['Season'], df['Game ID']]
+    df['swing_bin'] = _number_bins(df['Swing'])
+    df['swing_delta_bin'] = _delta_bins(swing_norm, swing_norm.groupby(game, sort=False).shift(1))
+    df['previous_pitch_bin'] = df['pitch_bin'].groupby(game, sort=False).shift(1).fillna(-1).astype(int)
+    return df
+
+def grouped_bincount(group_codes, values, num_groups, num_bins):
+    """Counts values in [0, num_bins) per group in one pass. Negative values are ignored."""
+    valid = (group_codes >= 0) & (values >= 0) & (values < num_bins)
+    flat = group_codes[valid] * num_bins + values[valid]
+    counts = np.bincount(flat, minlength=num_groups * num_bins)
+    return counts.reshape(num_groups, num_bins)
+
+def histogram_from_counts(counts, bin_size=PITCH_BIN_SIZE):
+    """Formats a count vector the same way as _get_pitch_histogram_data."""
+    output = []
+    for bin_id, count in enumerate(counts):
+        lower_bound = bin_id * bin_size
+        upper_bound = lower_bound + bin_size - 1
+        if lower_bound == 0: lower_bound = 1
+        output.append({'label': f"{lower_bound}-{upper_bound}", 'count': int(count)})
+    return output
+
+def delta_histogram_from_counts(counts):
+    """Formats a count vector the same way as _get_pitch_delta_histogram_data."""
+    return [{'label': label, 'count': int(count)} for label, count in zip(DELTA_LABELS, counts)]
+
+def _tendencies(n, repeats, triples, swing_matches, diff_matches, memes, opportunities=None):
+    if opportunities is None: opportunities = n - 1
+    return {
+        'repeat_percentage': round(repeats / opportunities * 100, 2) if opportunities > 0 else 0,
+        'has_tripled_up': bool(triples > 0),
+        'swing_match_rate': round(swing_matches / n * 100, 2),
+        'diff_match_rate': round(diff_matches / n * 100, 2),
+        'meme_percentage': round(memes / n * 100, 2)
+    }
+
+def _top_values(values, group_codes, n=5):
+    """Returns the n most common values per group as {group: {value: count}}."""
+    values = pd.DataFrame({'group': group_codes, 'value': values.to_numpy()}).dropna()
+    values = values[values['group'] >= 0]
+    counts = values.groupby(['group', 'value']).size().rename('count').reset_index()
+    counts.sort_values(by=['group', 'count'], ascending=[True, False], kind='stable', inplace=True)
+    counts = counts.groupby('group').head(n)
+
+    top_values = defaultdict(dict)
+    for group, value, count in counts.itertuples(index=False):
+        top_values[int(group)][int(value)] = int(count)
+    return top_values
+
+def get_split_reports(pitch_df, splits=REPORT_SPLITS):
+    """
+    Computes split scouting reports for every pitcher in pitch_df.
+
+    Each split column is used as an extra group key next to 'Pitcher ID', so all
+    pitchers and split values come out of one grouped pass over the sorted rows.
+    Only splits with at least one pitch are emitted.
+
+    Returns:
+        dict: {pitcher_id: {split_name: {split_value: report}}}
+    """
+    split_reports = {}
+    if pitch_df.empty: return split_reports
+
+    for split_name, split_col in splits.items():
+        keys = ['Pitcher ID', split_col]
+        grouped = pitch_df.groupby(keys, sort=False)
+        group_codes = grouped.ngroup().fillna(-1).astype(int).to_numpy()
+        num_groups = grouped.ngroups
+        if num_groups == 0: continue
+
+        previous = grouped[['Pitch', 'Swing', 'Diff']].shift(1)
+        pitch = pitch_df['Pitch']
+        repeats = (pitch == previous['Pitch']).to_numpy()
+        triples = repeats & (grouped['Pitch'].shift(2) == previous['Pitch']).to_numpy()
+        swing_matches = (pitch == previous['Swing']).to_numpy()
+        diff_matches = (pitch == previous['Diff']).to_numpy()
+        memes = pitch.isin(MEME_NUMBERS).to_numpy()
+
+        valid_codes = np.where(group_codes >= 0, group_codes, num_groups)
+        n = np.bincount(valid_codes, minlength=num_groups + 1)[:num_groups]
+        sums = {
+            name: np.bincount(valid_codes, weights=mask, minlength=num_groups + 1)[:num_groups]
+            for name, mask in [('repeat', repeats), ('triple', triples), ('swing', swing_matches), ('diff', diff_matches), ('meme', memes)]
+        }
+        histograms = grouped_bincount(group_codes, pitch_df['pitch_bin'].to_numpy(), num_groups, NUM_PITCH_BINS)
+        top_pitches = _top_values(pitch_df['Pitch'], group_codes)
+
+        group_keys = pitch_df[keys].groupby(group_codes).first()
+        for code, pitcher_id, split_value in group_keys.itertuples():
+            if code < 0 or n[code] == 0: continue
+            total = int(n[code])
+            report = {
+                'n': total,
+                'top_5_pitches': top_pitches.get(code, {}),
+                'histogram': histogram_from_counts(histograms[code]),
+                'tendencies': _tendencies(total, sums['repeat'][code], sums['triple'][code], sums['swing'][code], sums['diff'][code], sums['meme'][code])
+            }
+            split_reports.setdefault(int(pitcher_id), {}).setdefault(split_name, {})[str(split_value)] = report
+
+    return split_reports
+
+def get_recency_reports(pitch_df, current_season, windows=RECENCY_WINDOWS):
+    """
+    Computes recency window reports for every pitcher in pitch_df.
+
+    Per-row count vectors (pitch bins, delta bins and tendency indicators) are turned
+    into one prefix sum over the sorted rows. Game and pitcher boundaries are found
+    once, so every window is a subtraction of two prefix rows instead of a rescan.
+    Windows that would repeat the previous window of the same kind (e.g. the last 10
+    games of a pitcher with only 5) are skipped.
+
+    Returns:
+        dict: {pitcher_id: {window_name: report}}
+    """
+    recency_reports = {}
+    if pitch_df.empty: return recency_reports
+
+    num_rows = len(pitch_df)
+    pitcher_ids = pitch_df['Pitcher ID'].to_numpy()
+    season_nums = pitch_df['Season_num'].to_numpy()
+
+    new_pitcher = _run_starts(pitcher_ids)
+    new_game = _run_starts(pitcher_ids, season_nums, pitch_df['Game ID'].to_numpy())
+    pitcher_starts = np.flatnonzero(new_pitcher)
+    pitcher_ends = np.r_[pitcher_starts[1:], num_rows]
+    game_starts = np.flatnonzero(new_game)
+    first_game = np.searchsorted(game_starts, pitcher_starts)
+    num_games = np.r_[first_game[1:], len(game_starts)] - first_game
+
+    # Per-row count vectors. The previous-pitch indicators of a window's first row(s)
+    # refer to rows outside the window and are excluded when the window is summed.
+    pitch = pitch_df['Pitch'].to_numpy(dtype=float)
+    swing = pitch_df['Swing'].to_numpy(dtype=float)
+    diff = pitch_df['Diff'].to_numpy(dtype=float)
+    previous_pitch = np.r_[np.nan, pitch[:-1]]
+    repeats = pitch == previous_pitch
+    columns = {
+        'repeat': repeats,
+        'triple': repeats & (previous_pitch == np.r_[np.nan, previous_pitch[:-1]]),
+        'swing': pitch == np.r_[np.nan, swing[:-1]],
+        'diff': pitch == np.r_[np.nan, diff[:-1]],
+        'meme': np.isin(pitch, MEME_NUMBERS),
+    }
+    rows = np.arange(num_rows)
+    pitch_bins = pitch_df['pitch_bin'].to_numpy()
+    delta_bins = pitch_df['delta_bin'].to_numpy()
+    counts = np.zeros((num_rows, NUM_PITCH_BINS + len(DELTA_LABELS) + len(columns)))
+    counts[rows[pitch_bins >= 0], pitch_bins[pitch_bins >= 0]] = 1
+    counts[rows[delta_bins >= 0], NUM_PITCH_BINS + delta_bins[delta_bins >= 0]] = 1
+    for i, mask in enumerate(columns.values()):
+        counts[:, NUM_PITCH_BINS + len(DELTA_LABELS) + i] = mask
+    prefix = np.vstack([np.zeros(counts.shape[1]), np.cumsum(counts, axis=0)])
+    tendency_col = {name: NUM_PITCH_BINS + len(DELTA_LABELS) + i for i, name in enumerate(columns)}
+
+    # First row of the current season for each pitcher (its end row if it has none).
+    current_season_num = int(str(current_season).replace('S', ''))
+    in_current_season = np.where(season_nums >= current_season_num, rows, num_rows)
+    season_starts = np.minimum(np.minimum.reduceat(in_current_season, pitcher_starts), pitcher_ends)
+
+    def window_sum(starts, ends, col):
+        return prefix[ends, col] - prefix[np.minimum(starts, ends), col]
+
+    previous_starts = {}
+    for window_name, (kind, size) in windows.items():
+        if kind == 'games':
+            starts = game_starts[first_game + np.maximum(num_games - size, 0)]
+        elif kind == 'pitches':
+            starts = np.maximum(pitcher_starts, pitcher_ends - size)
+        elif kind == 'season':
+            starts = season_starts
+        else:
+            raise ValueError(f"Unknown recency window kind '{kind}' for '{window_name}'")
+        ends = pitcher_ends
+
+        emit = (ends > starts) & (starts != previous_starts.get(kind, -1))
+        previous_starts[kind] = starts
+
+        histograms = prefix[ends, :NUM_PITCH_BINS] - prefix[starts, :NUM_PITCH_BINS]
+        delta_cols = slice(NUM_PITCH_BINS, NUM_PITCH_BINS + len(DELTA_LABELS))
+        delta_histograms = prefix[ends, delta_cols] - prefix[np.minimum(starts + 1, ends), delta_cols]
+        sums = {
+            'repeat': window_sum(starts + 1, ends, tendency_col['repeat']),
+            'triple': window_sum(starts + 2, ends, tendency_col['triple']),
+            'swing': window_sum(starts + 1, ends, tendency_col['swing']),
+            'diff': window_sum(starts + 1, ends, tendency_col['diff']),
+            'meme': window_sum(starts, ends, tendency_col['meme']),
+        }
+        window_games = np.searchsorted(game_starts, ends - 1, side='right') - np.searchsorted(game_starts, starts, side='right') + 1
+
+        for i in np.flatnonzero(emit):
+            total = int(ends[i] - starts[i])
+            recency_reports.setdefault(int(pitcher_ids[pitcher_starts[i]]), {})[window_name] = {
+                'n': total,
+                'games': int(window_games[i]),
+                'histogram': histogram_from_counts(histograms[i]),
+                'delta_histogram': delta_histogram_from_counts(delta_histograms[i]),
+                'tendencies': _tendencies(total, sums['repeat'][i], sums['triple'][i], sums['swing'][i], sums['diff'][i], sums['meme'][i])
+            }
+
+    return recency_reports
+
+def _signed_deltas(numbers):
+    """Consecutive deltas wrapped into [-500, 500], as in recent_games_info."""
+    numbers = numbers[~np.isnan(numbers)]
+    numbers = np.where(numbers == 1000, 0, numbers)
+    deltas = numbers[1:] - numbers[:-1]
+    deltas = np.where(deltas > 500, deltas - 1000, np.where(deltas < -500, deltas + 1000, deltas))
+    return [int(d) for d in deltas]
+
+def get_hitter_reports(swing_df, hitter_ids=None, num_recent_games=5):
+    """
+    Computes hitter scouting reports from the hitter-sorted typed columns.
+
+    Every histogram is one grouped bincount over all hitters, keyed by hitter and,
+    where needed, by season, previous pitch bucket or swing bucket.
+
+    Returns:
+        dict: {hitter_id: report}
+    """
+    hitter_reports = {}
+    if hitter_ids is not None:
+        swing_df = swing_df[swing_df['Hitter ID'].isin(hitter_ids)].reset_index(drop=True)
+    if swing_df.empty: return hitter_reports
+
+    hitter_codes, hitters = pd.factorize(swing_df['Hitter ID'])
+    num_hitters = len(hitters)
+    season_codes, seasons = pd.factorize(swing_df['Season'])
+    result_codes, results = pd.factorize(swing_df['Exact Result'])
+    swing_bins = swing_df['swing_bin'].to_numpy()
+    previous_pitch_bins = swing_df['previous_pitch_bin'].to_numpy()
+
+    new_hitter = _run_starts(hitter_codes)
+    new_game = _run_starts(hitter_codes, season_codes, swing_df['Game ID'].to_numpy())
+    risp = swing_df['OBC'].to_numpy() > 1
+
+    def by_hitter(mask=None):
+        codes = hitter_codes if mask is None else np.where(mask, hitter_codes, -1)
+        return grouped_bincount(codes, swing_bins, num_hitters, NUM_PITCH_BINS)
+
+    overall = by_hitter()
+    first_of_game = by_hitter(new_game)
+    risp_counts = by_hitter(risp)
+    after_pitch = grouped_bincount(
+        np.where(previous_pitch_bins >= 0, hitter_codes * NUM_PITCH_BINS + previous_pitch_bins, -1),
+        swing_bins, num_hitters * NUM_PITCH_BINS, NUM_PITCH_BINS
+    ).reshape(num_hitters, NUM_PITCH_BINS, NUM_PITCH_BINS)
+    by_season = grouped_bincount(
+        hitter_codes * len(seasons) + season_codes, swing_bins, num_hitters * len(seasons), NUM_PITCH_BINS
+    ).reshape(num_hitters, len(seasons), NUM_PITCH_BINS)
+    deltas = grouped_bincount(hitter_codes, swing_df['swing_delta_bin'].to_numpy(), num_hitters, len(DELTA_LABELS))
+    results_by_swing = grouped_bincount(
+        np.where(swing_bins >= 0, hitter_codes * NUM_PITCH_BINS + swing_bins, -1),
+        result_codes, num_hitters * NUM_PITCH_BINS, len(results)
+    ).reshape(num_hitters, NUM_PITCH_BINS, len(results))
+
+    # Tendencies over each hitter's whole swing sequence.
+    swing = swing_df['Swing'].to_numpy(dtype=float)
+    pitch = swing_df['Pitch'].to_numpy(dtype=float)
+    previous_swing = np.r_[np.nan, swing[:-1]]
+    repeats = (swing == previous_swing) & ~new_hitter
+    triples = repeats & np.r_[False, repeats[:-1]]
+    previous_pitch_matches = (swing == np.r_[np.nan, pitch[:-1]]) & ~new_hitter
+    n = np.bincount(hitter_codes, minlength=num_hitters)
+    sums = {
+        name: np.bincount(hitter_codes, weights=mask, minlength=num_hitters)
+        for name, mask in [('repeat', repeats), ('triple', triples), ('pitch', previous_pitch_matches), ('meme', np.isin(swing, MEME_NUMBERS))]
+    }
+    top_swings = _top_values(swing_df['Swing'], hitter_codes)
+
+    game_starts = np.flatnonzero(new_game)
+    game_ends = np.r_[game_starts[1:], len(swing_df)]
+    hitter_first_game = np.searchsorted(game_starts, np.flatnonzero(new_hitter))
+    hitter_last_game = np.r_[hitter_first_game[1:], len(game_starts)]
+    seasons_col = swing_df['Season'].to_numpy()
+    sessions = swing_df['Session'].to_numpy()
+    batter_teams = swing_df['Batter Team'].to_numpy()
+    pitcher_teams = swing_df['Pitcher Team'].to_numpy()
+
+    for h, hitter_id in enumerate(hitters):
+        total = int(n[h])
+        opportunities = total - 1
+
+        recent_games_info = []
+        for g in range(hitter_last_game[h] - 1, max(hitter_first_game[h], hitter_last_game[h] - num_recent_games) - 1, -1):
+            start, end = game_starts[g], game_ends[g]
+            game_swings = swing[start:end]
+            recent_games_info.append({
+                'batter_team': batter_teams[start],
+                'season': seasons_col[start],
+                'session': int(sessions[start]),
+                'opponent': pitcher_teams[start],
+                'swings': [int(x) for x in game_swings[~np.isnan(game_swings)]],
+                'deltas': _signed_deltas(game_swings)
+            })
+
+        hitter_reports[int(hitter_id)] = {
+            "top_5_swings": top_swings.get(h, {}),
+            "histograms": {
+                "overall": histogram_from_counts(overall[h]),
+                "first_of_game": histogram_from_counts(first_of_game[h]),
+                "risp": histogram_from_counts(risp_counts[h])
+            },
+            "tendencies": {
+                "repeat_percentage": round(sums['repeat'][h] / opportunities * 100, 2) if opportunities > 0 else 0,
+                "has_tripled_up": bool(sums['triple'][h] > 0),
+                "previous_pitch_rate": round(sums['pitch'][h] / total * 100, 2),
+                "meme_percentage": round(sums['meme'][h] / total * 100, 2)
+            },
+            "conditional_histograms": {
+                f'after_{i}00s': histogram_from_counts(after_pitch[h, i])
+                for i in range(NUM_PITCH_BINS) if after_pitch[h, i].sum() > 0
+            },
+            "season_histograms": {
+                season: histogram_from_counts(by_season[h, s])
+                for s, season in enumerate(seasons) if by_season[h, s].sum() > 0
+            },
+            "delta_histograms": {"overall": delta_histogram_from_counts(deltas[h])} if deltas[h].sum() > 0 else {},
+            "results_by_swing": [
+                {'label': bin_hist['label'], 'results': {results[r]: int(c) for r, c in enumerate(results_by_swing[h, b]) if c > 0}}
+                for b, bin_hist in enumerate(histogram_from_counts(overall[h]))
+            ],
+            "recent_games_info": recent_games_info
+        }
+
+    return hitter_reports
+
+def _franchise_keys(teams, season_nums, team_history):
+    """Maps (abbreviation, season) pairs to franchise keys using the team_history.json lineage."""
+    lineage = pd.DataFrame([
+        {'team': entry['abbr'], 'franchise': franchise_key, 'start': entry['start'], 'end': entry['end']}
+        for franchise_key, entries in team_history.items() for entry in entries
+    ], columns=['team', 'franchise', 'start', 'end'])
+    pairs = pd.DataFrame({'team': teams, 'season': season_nums}).drop_duplicates()
+    matched = pairs.merge(lineage, on='team', how='left')
+    matched = matched[(matched['season'] >= matched['start']) & (matched['season'] <= matched['end'])]
+    matched = matched.drop_duplicates(subset=['team', 'season'])
+    keys = pd.DataFrame({'team': teams, 'season': season_nums}).merge(matched, on=['team', 'season'], how='left')['franchise']
+    # Abbreviations missing from the lineage are their own franchise, as in the web app.
+    return keys.fillna(pd.Series(teams)).to_numpy()
+
+def get_team_reports(pitch_df, team_history):
+    """
+    Computes pitching-staff reports for every team and season in pitch_df.
+
+    Count vectors (pitch bins, delta bins, tendency indicators, games and starts) are
+    built once per (franchise, season, pitcher) in one grouped pass, and each staff
+    report is the sum of its pitchers' vectors. 'Pitcher Team' abbreviations are
+    resolved to franchise keys through the team_history.json lineage, so a renamed or
+    relocated team keeps one history. Pitchers with temporary (non-positive) IDs count
+    towards the staff totals but are left out of the 'pitchers' list.
+
+    Returns:
+        dict: {franchise_key: {season: report}}
+    """
+    team_reports = {}
+    if pitch_df.empty: return team_reports
+
+    df = pitch_df[pitch_df['Pitcher Team'].notna()]
+    franchise = _franchise_keys(df['Pitcher Team'].to_numpy(), df['Season_num'].to_numpy(), team_history)
+    grouped = df.groupby([franchise, df['Season_num'], df['Pitcher ID']], sort=True)
+    group_codes = grouped.ngroup().to_numpy()
+    num_groups = grouped.ngroups
+
+    previous = grouped[['Pitch', 'Swing', 'Diff']].shift(1)
+    pitch = df['Pitch']
+    repeats = (pitch == previous['Pitch']).to_numpy()
+    indicators = {
+        'repeat': repeats,
+        'triple': repeats & (grouped['Pitch'].shift(2) == previous['Pitch']).to_numpy(),
+        'swing': (pitch == previous['Swing']).to_numpy(),
+        'diff': (pitch == previous['Diff']).to_numpy(),
+        'meme': pitch.isin(MEME_NUMBERS).to_numpy(),
+    }
+
+    # A game's starter is whoever threw the team's first pitch of it in gamelog order.
+    game_keys = [df['Season'], df['Game ID'], franchise]
+    first_row = df['row'].groupby(game_keys, sort=False).transform('min')
+    starter_id = df['Pitcher ID'].where(df['row'] == first_row).groupby(game_keys, sort=False).transform('max')
+    is_start = (df['row'] == first_row).to_numpy()
+    by_starter = (df['Pitcher ID'] == starter_id).to_numpy()
+    new_game = _run_starts(group_codes, df['Game ID'].to_numpy())
+
+    # Per-pitcher count vectors.
+    columns = [np.ones(len(df), dtype=bool), new_game, is_start, by_starter] + list(indicators.values())
+    pitcher_counts = np.column_stack([
+        np.bincount(group_codes, weights=column, minlength=num_groups) for column in columns
+    ] + [
+        grouped_bincount(group_codes, df['pitch_bin'].to_numpy(), num_groups, NUM_PITCH_BINS),
+        grouped_bincount(group_codes, df['delta_bin'].to_numpy(), num_groups, len(DELTA_LABELS)),
+    ])
+    n_col, games_col, starts_col, starter_pitches_col = 0, 1, 2, 3
+    tendency_col = {name: 4 + i for i, name in enumerate(indicators)}
+    pitch_cols = slice(4 + len(indicators), 4 + len(indicators) + NUM_PITCH_BINS)
+    delta_cols = slice(pitch_cols.stop, pitch_cols.stop + len(DELTA_LABELS))
+
+    # Staff vectors are the sums of their pitchers' vectors.
+    group_keys = df[['Season', 'Pitcher ID']].groupby(group_codes).first()
+    group_keys['franchise'] = pd.Series(franchise).groupby(group_codes).first()
+    team_codes, teams = pd.factorize(pd.MultiIndex.from_arrays([group_keys['franchise'], group_keys['Season']]))
+    team_counts = np.zeros((len(teams), pitcher_counts.shape[1]))
+    np.add.at(team_counts, team_codes, pitcher_counts)
+    num_pitchers = np.bincount(team_codes, minlength=len(teams))
+    team_games = df.groupby([franchise, df['Season']], sort=False)['Game ID'].nunique()
+
+    abbreviations = pd.Series(df['Pitcher Team'].to_numpy()).groupby([franchise, df['Season'].to_numpy()]).agg(lambda teams: teams.mode().iat[0])
+    top_pitches = _top_values(pitch, team_codes[group_codes])
+
+    for t, (franchise_key, season) in enumerate(teams):
+        counts = team_counts[t]
+        total = int(counts[n_col])
+        games = int(team_games[(franchise_key, season)])
+        pitchers = [
+            {
+                'id': int(pitcher_id),
+                'pitches': int(pitcher_counts[g, n_col]),
+                'games': int(pitcher_counts[g, games_col]),
+                'starts': int(pitcher_counts[g, starts_col]),
+            }
+            for g, pitcher_id in zip(np.flatnonzero(team_codes == t), group_keys['Pitcher ID'].to_numpy()[team_codes == t])
+            if pitcher_id > 0
+        ]
+        pitchers.sort(key=lambda pitcher: pitcher['pitches'], reverse=True)
+        team_reports.setdefault(franchise_key, {})[season] = {
+            'team': abbreviations[(franchise_key, season)],
+            'n': total,
+            'top_5_pitches': top_pitches.get(t, {}),
+            'histogram': histogram_from_counts(counts[pitch_cols]),
+            'delta_histogram': delta_histogram_from_counts(counts[delta_cols]),
+            'tendencies': _tendencies(
+                total, counts[tendency_col['repeat']], counts[tendency_col['triple']], counts[tendency_col['swing']],
+                counts[tendency_col['diff']], counts[tendency_col['meme']], opportunities=total - num_pitchers[t]
+            ),
+            'bullpen': {
+                'games': games,
+                'pitchers_used': int(num_pitchers[t]),
+                'pitchers_per_game': round(counts[games_col] / games, 2) if games > 0 else 0,
+                'starter_pitch_share': round(counts[starter_pitches_col] / total * 100, 2) if total > 0 else 0,
+            },
+            'pitchers': pitchers,
+        }
+
+    return team_reports
@@ -28,28 +28,119 @@ def get_export_url(url):
 
 import numpy as np
 import os
+import io
 import json
+import pickle
+import hashlib
+import urllib.request
 
 # --- Caching Helper Functions ---
 def _read_cache_manifest(cache_dir):
     manifest_path = os.path.join(cache_dir, 'cache_info.json')
     if not os.path.exists(manifest_path):
-        return None
+        return None, None
     try:
         with open(manifest_path, 'r') as f:
             data = json.load(f)
-            return data.get('last_run_most_recent')
+            return data.get('last_run_most_recent'), data.get('tail_state')
     except (json.JSONDecodeError, IOError):
-        return None
+        return None, None
 
-def _write_cache_manifest(cache_dir, most_recent_season):
+def _write_cache_manifest(cache_dir, most_recent_season, tail_state=None):
     manifest_path = os.path.join(cache_dir, 'cache_info.json')
+    manifest = {'last_run_most_recent': most_recent_season}
+    if tail_state:
+        manifest['tail_state'] = tail_state
     try:
         with open(manifest_path, 'w') as f:
-            json.dump({'last_run_most_recent': most_recent_season}, f)
+            json.dump(manifest, f)
     except IOError:
         print("Warning: Could not write to cache manifest file.")
 
+def _download_csv_lines(export_url):
+    with urllib.request.urlopen(export_url) as response:
+        text = response.read().decode('utf-8')
+    return [line for line in text.splitlines() if line]
+
+def _parse_csv_lines(header, rows):
+    return pd.read_csv(io.StringIO('\n'.join([header] + rows) + '\n'))
+
+def _write_csv_lines(path, lines, mode='w'):
+    with open(path, mode) as f:
+        f.write('\n'.join(lines) + '\n')
+
+def _hash_rows(header, rows):
+    """Hashes the header and all of the given rows."""
+    return hashlib.sha256('\n'.join([header] + rows).encode('utf-8')).hexdigest()
+
+def _read_parsed_cache(path, prefix_hash):
+    """Returns the parsed rows pickled with prefix_hash, or None if the pickle is missing or stale."""
+    try:
+        with open(path, 'rb') as f:
+            cached_hash, cached_df = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    return cached_df if cached_hash == prefix_hash else None
+
+def _write_parsed_cache(path, prefix_hash, df):
+    with open(path, 'wb') as f:
+        pickle.dump((prefix_hash, df), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _load_appended_rows(season, lines, raw_cache_path, tail_state):
+    """
+    Loads the in-progress season, parsing only the rows appended since the last refresh.
+
+    The sheet is append-only during the season, so if the row count and hash of every
+    row recorded last time still match the start of the new download, the already-parsed
+    rows are loaded from a pickle next to the CSV cache (tied to that hash) and only the
+    new tail is parsed and appended. Any other change (e.g. a commissioner edit to an
+    earlier game) falls back to a full reload. Hashing the text is far cheaper than
+    parsing it.
+
+    Returns:
+        tuple: (DataFrame, new tail state).
+    """
+    header, rows = lines[0], lines[1:]
+    parsed_cache_path = os.path.splitext(raw_cache_path)[0] + '.pkl'
+    new_tail_state = {
+        'season': season,
+        'row_count': len(rows),
+        'prefix_hash': _hash_rows(header, rows),
+    }
+
+    prefix_count = 0
+    if tail_state and tail_state.get('season') == season and os.path.exists(raw_cache_path):
+        prefix_count = tail_state.get('row_count', 0)
+        if (prefix_count > len(rows)
+                or _hash_rows(header, rows[:prefix_count]) != tail_state.get('prefix_hash')):
+            print(f"Earlier rows of {season} changed since the last refresh. Reloading the full season...")
+            prefix_count = 0
+
+    df = None
+    if prefix_count > 0:
+        try:
+            cached_df = _read_parsed_cache(parsed_cache_path, tail_state['prefix_hash'])
+            if cached_df is None or len(cached_df) != prefix_count:
+                raise ValueError("parsed cache is missing or out of date")
+            tail_rows = rows[prefix_count:]
+            if tail_rows:
+                df = pd.concat([cached_df, _parse_csv_lines(header, tail_rows)], ignore_index=True)
+                _write_csv_lines(raw_cache_path, tail_rows, mode='a')
+                _write_parsed_cache(parsed_cache_path, new_tail_state['prefix_hash'], df)
+            else:
+                df = cached_df
+            print(f"Loaded {len(tail_rows)} new rows for {season} ({prefix_count} cached rows unchanged).")
+        except Exception as e:
+            print(f"Error appending new rows for {season}: {e}. Reloading the full season...")
+            df = None
+
+    if df is None:
+        df = _parse_csv_lines(header, rows)
+        _write_csv_lines(raw_cache_path, lines)
+        _write_parsed_cache(parsed_cache_path, new_tail_state['prefix_hash'], df)
+
+    return df, new_tail_state
+
 def load_all_seasons():
     """Loads all seasons' data, adding a 'GameType' column and caching raw downloads."""
     season_data = {}
@@ -69,7 +160,7 @@ def load_all_seasons():
         return None
 
     # Determine season transition for cache invalidation
-    previous_most_recent = _read_cache_manifest(cache_dir)
+    previous_most_recent, tail_state = _read_cache_manifest(cache_dir)
     season_lines = [line.strip().split('\t') for line in gamelogs if line.strip()]
     all_season_names = [parts[0] for parts in season_lines if len(parts) > 0]
     if all_season_names:
@@ -106,8 +197,12 @@ def load_all_seasons():
             if export_url:
                 try:
                     print(f"Downloading data for {season}...")
-                    df = pd.read_csv(export_url)
-                    df.to_csv(raw_cache_path, index=False)
+                    lines = _download_csv_lines(export_url)
+                    if season == most_recent_season:
+                        df, tail_state = _load_appended_rows(season, lines, raw_cache_path, tail_state)
+                    else:
+                        df = _parse_csv_lines(lines[0], lines[1:])
+                        _write_csv_lines(raw_cache_path, lines)
                 except Exception as e:
                     print(f"Error loading data for {season} from URL: {e}")
                     continue
@@ -126,7 +221,7 @@ def load_all_seasons():
             except ValueError:
                 print(f"Warning: Invalid number of games for season '{season}'.")
 
-    _write_cache_manifest(cache_dir, most_recent_season)
+    _write_cache_manifest(cache_dir, most_recent_season, tail_state)
     return season_data, most_recent_season, [most_recent_season] + seasons_to_recalc if most_recent_season else seasons_to_recalc
 
 def load_player_id_map():
@@ -0,0 +1,306 @@
+import numpy as np
+import pandas as pd
+import json
+import os
+from batch_aggregation import STEAL_PATTERN
+
+# Severity of each check, used to rank the anomaly report (higher first).
+CHECK_SEVERITY = {
+    'flipped_teams': 5,
+    'half_inning_teams': 5,
+    'player_on_both_teams': 4,
+    'duplicate_play': 4,
+    'score_decrease': 4,
+    'fielding_team_scored': 4,
+    'game_ending': 4,
+    'half_inning_ending': 3,
+    'base_out_state': 3,
+    'runner_conservation': 3,
+    'run_total': 2,
+    'rbi_exceeds_runs': 2,
+}
+
+REGULATION_INNINGS = 6
+# Number of runners on base for each OBC code.
+RUNNERS_ON_BASE = {0: 0, 1: 1, 2: 1, 3: 1, 4: 2, 5: 2, 6: 2, 7: 3}
+# Results that can record the third out of a half-inning.
+OUT_RESULTS = {'K', 'AUTO K', 'BUNT K', 'FO', 'PO', 'LO', 'LGO', 'RGO', 'BUNT GO', 'BUNT SAC', 'SAC',
+               'DP', 'BUNT DP', 'TP', 'CS', 'CS 2B', 'CS 3B', 'CS HOME', 'CMS 3B', 'CMS HOME'}
+# Results that can record two or three outs at once.
+MULTI_OUT_RESULTS = {'LGO', 'RGO', 'DP', 'BUNT DP', 'TP'}
+
+def _correction_mask(row, id_col='Hitter ID'):
+    # Seasons without 'Exact Result' (S2, S3) are matched on 'Old Result', like the existing corrections.
+    return (
+        f"    correction_mask = (\n"
+        f"        (df['{id_col}'] == {int(row[id_col])}) &\n"
+        f"        (df['Inning'] == '{row['Inning']}') &\n"
+        f"        (df['{row['result_col']}'] == '{row['Exact Result']}')\n"
+        f"    )\n"
+    )
+
+def _play_header(row):
+    return f"# {row['Season']}, Game {row['Game ID']}: Hitter {int(row['Hitter ID'])} {row['Exact Result']} in {row['Inning']}\n"
+
+def _suggest_correction(row):
+    """Formats a suggested entry for apply_gamelog_corrections, in the style of the existing ones."""
+    check = row['check']
+    header = f"elif season == '{row['Season']}' and game_id == {row['Game ID']}:\n"
+    if check == 'flipped_teams':
+        team_a, team_b = row['Batter Team'], row['Pitcher Team']
+        return (
+            f"# {row['Season']}, Game {row['Game ID']}: Flipped batter/pitcher teams\n" + header +
+            f"    team_map = {{'{team_a}': '{team_b}', '{team_b}': '{team_a}'}}\n"
+            f"    df['Batter Team'] = df['Batter Team'].replace(team_map)\n"
+            f"    df['Pitcher Team'] = df['Pitcher Team'].replace(team_map)"
+        )
+    if check == 'player_on_both_teams':
+        return (
+            f"# {row['Season']}, Game {row['Game ID']}: Remove play credited to the wrong pitcher\n" + header +
+            _correction_mask(row, 'Pitcher ID').replace('correction_mask', 'removal_mask') +
+            f"    df = df[~removal_mask]"
+        )
+    if check == 'duplicate_play':
+        return (
+            f"# {row['Season']}, Game {row['Game ID']}: Remove replayed {row['Exact Result']}\n" + header +
+            _correction_mask(row).replace('correction_mask', 'duplicate_mask') +
+            f"    df = df.drop(df[duplicate_mask].index[1:])"
+        )
+    if check == 'rbi_exceeds_runs':
+        return (
+            _play_header(row) + header +
+            _correction_mask(row) +
+            f"    df.loc[correction_mask, 'RBI'] = {int(row['runs'])}"
+        )
+    if check == 'base_out_state' and isinstance(row.get('fix_col'), str):
+        return (
+            _play_header(row) + header +
+            _correction_mask(row) +
+            f"    df.loc[correction_mask, '{row['fix_col']}'] = {int(row['fix_value'])}"
+        )
+    # The remaining checks cannot tell which row is wrong, so the fix is left as a comment.
+    if check == 'runner_conservation':
+        return (
+            _play_header(row) + header +
+            _correction_mask(row) +
+            f"    # {int(row['expected_runners'])} runner(s) expected on base after this play: "
+            f"fix 'OBC' on the next play, or 'RBI'/'Outs' on this one"
+        )
+    if check == 'run_total':
+        return (
+            _play_header(row) + header +
+            f"    half_inning_mask = df['Inning'] == '{row['Inning']}'\n"
+            f"    # Set 'Run' = 1 on the hitters who scored so the half-inning credits "
+            f"{int(row['half_runs'])} run(s) instead of {int(row['run_credits'])}"
+        )
+    if check == 'base_out_state':
+        return (
+            _play_header(row) + header +
+            _correction_mask(row) +
+            f"    # {row['message']}: fix 'Outs'/'OBC' on this play or the previous one"
+        )
+    if check in ('game_ending', 'half_inning_ending'):
+        # Fill in the None values from the game thread.
+        return (
+            f"# {row['Season']}, Game {row['Game ID']}: Add missing play after {row['Inning']}\n" + header +
+            f"    new_play_data = {{\n"
+            f"        'Hitter': None,\n"
+            f"        'Hitter ID': None,\n"
+            f"        'Swing': None,\n"
+            f"        'Pitcher ID': {int(row['Pitcher ID'])},\n"
+            f"        'Pitch': None,\n"
+            f"        'Diff': None,\n"
+            f"        'Inning': '{row['Inning']}',\n"
+            f"        'Outs': None,\n"
+            f"        'OBC': None,\n"
+            f"        'Home Score': None,\n"
+            f"        'Away Score': None,\n"
+            f"        'RBI': 0,\n"
+            f"        'Run': 0,\n"
+            f"        'Batter Team': '{row['Batter Team']}',\n"
+            f"        'Pitcher Team': '{row['Pitcher Team']}',\n"
+            f"        'Old Result': None,\n"
+            f"        'Exact Result': None\n"
+            f"    }}\n"
+            f"    new_play_df = pd.DataFrame([new_play_data])\n"
+            f"    df = pd.concat([df, new_play_df], ignore_index=True)"
+        )
+    return ''
+
+def find_gamelog_anomalies(combined_df):
+    """
+    Checks gamelog invariants across all seasons and returns a ranked anomaly report.
+
+    All checks are grouped or shifted column operations over the plays sorted by
+    season, game and gamelog order:
+        - team consistency per half-inning and per game, flipped teams, and
+          players appearing for both teams in one game
+        - outs/OBC state at the start of each half-inning and between plays
+        - runner conservation: runners before + batter = runners after + runs + outs
+        - score continuity against 'RBI' and 'Run'
+        - half-innings and games that end without a final out (missing plays),
+          except in the latest session, whose games may still be in progress
+        - consecutive duplicate plays
+
+    Args:
+        combined_df (pd.DataFrame): All seasons' plays, with a 'Season' column.
+
+    Returns:
+        pd.DataFrame: One row per anomaly, sorted by severity, with a suggested
+        entry for apply_gamelog_corrections where one can be inferred.
+    """
+    df = combined_df.copy()
+    df['Season_num'] = df['Season'].str.replace('S', '').astype(int)
+    df['order'] = np.arange(len(df))
+    df.sort_values(by=['Season_num', 'Game ID', 'order'], kind='stable', inplace=True)
+    df.reset_index(drop=True, inplace=True)
+
+    result_col = np.where(df['Exact Result'].isna(), 'Old Result', 'Exact Result')
+    df['Exact Result'] = df['Exact Result'].fillna(df['Old Result'])
+    result = df['Exact Result'].astype(str).str.upper()
+    inning = df['Inning'].astype(str)
+    is_top = inning.str.startswith('T').to_numpy()
+    inning_num = pd.to_numeric(inning.str[1:], errors='coerce')
+    outs = pd.to_numeric(df['Outs'], errors='coerce')
+    obc = pd.to_numeric(df['OBC'], errors='coerce')
+    rbi = pd.to_numeric(df['RBI'], errors='coerce').fillna(0)
+    run = pd.to_numeric(df['Run'], errors='coerce').fillna(0)
+    home_score = pd.to_numeric(df['Home Score'], errors='coerce')
+    away_score = pd.to_numeric(df['Away Score'], errors='coerce')
+    runners = obc.map(RUNNERS_ON_BASE)
+    is_steal = result.str.contains(STEAL_PATTERN, na=False)
+
+    game_keys = [df['Season'], df['Game ID']]
+    half_keys = game_keys + [df['Inning']]
+    new_game = ((df['Season'] != df['Season'].shift()) | (df['Game ID'] != df['Game ID'].shift())).to_numpy()
+    new_half = new_game | (inning != inning.shift()).to_numpy()
+    last_in_game = np.r_[new_game[1:], True]
+    last_in_half = np.r_[new_half[1:], True]
+
+    # Score continuity: the batting team's score change up to the next play of the game.
+    batting_score = pd.Series(np.where(is_top, away_score, home_score))
+    fielding_score = pd.Series(np.where(is_top, home_score, away_score))
+    next_batting_score = pd.Series(np.where(is_top, away_score.shift(-1), home_score.shift(-1)))
+    next_fielding_score = pd.Series(np.where(is_top, home_score.shift(-1), away_score.shift(-1)))
+    runs = (next_batting_score - batting_score).where(~last_in_game)
+    fielding_runs = (next_fielding_score - fielding_score).where(~last_in_game)
+
+    anomalies = []
+
+    def flag(check, mask, message, **extra):
+        mask = pd.Series(mask).fillna(False).to_numpy(dtype=bool)
+        if not mask.any(): return
+        found = df.loc[mask, ['Season', 'Game ID', 'Inning', 'Hitter ID', 'Pitcher ID', 'Exact Result', 'Batter Team', 'Pitcher Team']].copy()
+        found['check'] = check
+        found['result_col'] = result_col[mask]
+        found['message'] = message[mask] if isinstance(message, pd.Series) else message
+        for name, values in extra.items():
+            found[name] = values[mask] if isinstance(values, pd.Series) else values
+        anomalies.append(found)
+
+    # --- Teams ---
+    batter_teams = df.groupby(half_keys, sort=False)['Batter Team'].transform('nunique')
+    pitcher_teams = df.groupby(half_keys, sort=False)['Pitcher Team'].transform('nunique')
+    flag('half_inning_teams', new_half & ((batter_teams > 1) | (pitcher_teams > 1)).to_numpy(),
+         'Batter Team/Pitcher Team change within the half-inning')
+    flag('half_inning_teams', (df['Batter Team'] == df['Pitcher Team']).to_numpy(), 'Batter Team equals Pitcher Team')
+
+    # The away team bats in the top of every inning and fields in the bottom.
+    away_team = df['Batter Team'].where(is_top, df['Pitcher Team'])
+    flag('half_inning_teams', new_game & (away_team.groupby(game_keys, sort=False).transform('nunique') > 1).to_numpy(),
+         'Away team differs between innings of the game')
+
+    pitcher_game_teams = df.groupby(game_keys + [df['Pitcher ID']], sort=False)['Pitcher Team']
+    on_both_teams = pitcher_game_teams.transform('nunique') > 1
+    team_share = df.groupby(game_keys + [df['Pitcher ID'], df['Pitcher Team']], sort=False)['Pitcher Team'].transform('size') / pitcher_game_teams.transform('size')
+    flag('player_on_both_teams', (on_both_teams & (team_share < 0.5)).to_numpy(),
+         'Pitcher also pitched for the other team in this game')
+
+    # Flipped teams: most hitters in the game bat for the team they usually field against this season.
+    team_counts = df.groupby(['Season', 'Hitter ID', 'Batter Team']).size().rename('count').reset_index()
+    team_counts.sort_values(by='count', ascending=False, kind='stable', inplace=True)
+    usual_team = df[['Season', 'Hitter ID']].merge(
+        team_counts.drop_duplicates(subset=['Season', 'Hitter ID']), on=['Season', 'Hitter ID'], how='left'
+    )['Batter Team'].to_numpy()
+    swapped_share = pd.Series(usual_team == df['Pitcher Team'].to_numpy()).groupby(game_keys, sort=False).transform('mean')
+    flag('flipped_teams', new_game & (swapped_share > 0.5).to_numpy(),
+         'Most hitters bat for the team they usually play against; Batter Team/Pitcher Team look flipped')
+
+    # --- Base/out state ---
+    flag('base_out_state', (~outs.isin([0, 1, 2])).to_numpy(), 'Outs outside 0-2')
+    flag('base_out_state', (~obc.isin(list(RUNNERS_ON_BASE))).to_numpy(), 'OBC outside 0-7')
+    flag('base_out_state', new_half & (outs != 0).to_numpy(), 'Half-inning does not start with 0 outs',
+         fix_col='Outs', fix_value=0)
+    flag('base_out_state', new_half & (obc != 0).to_numpy() & (inning_num <= REGULATION_INNINGS).to_numpy(),
+         'Half-inning does not start with the bases empty', fix_col='OBC', fix_value=0)
+
+    outs_added = (outs.shift(-1) - outs).where(~last_in_half)
+    flag('base_out_state', (outs_added < 0).to_numpy(), 'Outs decrease within the half-inning')
+
+    batter = np.where(is_steal, 0, 1)
+    expected_runners = runners + batter - runs - outs_added
+    imbalance = (expected_runners - runners.shift(-1)).where(~last_in_half)
+    flag('runner_conservation', (imbalance != 0).to_numpy() & imbalance.notna().to_numpy(),
+         'Runners before + batter != runners after + runs + outs (expected ' + expected_runners.astype('Int64').astype(str) +
+         ' on base after the play, next play has ' + runners.shift(-1).astype('Int64').astype(str) + ')',
+         expected_runners=expected_runners)
+
+    # --- Scores ---
+    flag('score_decrease', (runs < 0).to_numpy(), 'Batting team score decreases after this play')
+    flag('fielding_team_scored', (fielding_runs != 0).to_numpy() & fielding_runs.notna().to_numpy(),
+         'Fielding team score changes after this play')
+    flag('rbi_exceeds_runs', (rbi > runs).to_numpy() & runs.notna().to_numpy(),
+         'RBI ' + rbi.astype(int).astype(str) + ' but ' + runs.astype('Int64').astype(str) + ' run(s) scored', runs=runs)
+
+    # Runs credited via 'Run' in a half-inning should match the runs scored in it. The
+    # last play of a game has no next score, so its RBI stands in for its runs. Extra
+    # innings start with a runner on base who is not credited, so only regulation is checked.
+    half_runs = runs.fillna(rbi).groupby(half_keys, sort=False).transform('sum')
+    half_run_credits = run.groupby(half_keys, sort=False).transform('sum')
+    flag('run_total', last_in_half & (half_runs != half_run_credits).to_numpy() & (inning_num <= REGULATION_INNINGS).to_numpy(),
+         'Half-inning scored ' + half_runs.astype(int).astype(str) + ' run(s) but credits ' + half_run_credits.astype(int).astype(str) + " in 'Run'",
+         half_runs=half_runs, run_credits=half_run_credits)
+
+    # --- Missing plays ---
+    # Games in the latest session of the latest season may still be in progress, so
+    # they are not checked for a missing final play.
+    session = pd.to_numeric(df['Session'], errors='coerce')
+    latest_season = df['Season_num'] == df['Season_num'].max()
+    in_progress = (latest_season & (session == session[latest_season].max())).to_numpy()
+    is_out = result.isin(OUT_RESULTS)
+    can_end_half = (is_out & ((outs == 2) | (result.isin(MULTI_OUT_RESULTS) & (outs == 1)) | (result == 'TP'))).to_numpy()
+    flag('half_inning_ending', last_in_half & ~last_in_game & ~can_end_half & ~in_progress,
+         'Half-inning ends on a play that cannot be the third out')
+
+    final_home = (home_score + np.where(is_top, 0, rbi)).to_numpy()
+    final_away = (away_score + np.where(is_top, rbi, 0)).to_numpy()
+    walk_off = ~is_top & (final_home > final_away)
+    completed = can_end_half & ((is_top & (final_home > final_away)) | (~is_top & (final_home < final_away)))
+    flag('game_ending', last_in_game & ~in_progress & (final_home == final_away), 'Game ends tied')
+    flag('game_ending', last_in_game & ~in_progress & (final_home != final_away) & ~(walk_off | completed),
+         'Game ends without a final out or walk-off')
+
+    # --- Duplicates ---
+    play_cols = ['Inning', 'Outs', 'OBC', 'Home Score', 'Away Score', 'Hitter ID', 'Pitcher ID', 'Pitch', 'Swing', 'Exact Result']
+    same_as_previous = (df[play_cols].eq(df[play_cols].shift()) | (df[play_cols].isna() & df[play_cols].shift().isna())).all(axis=1)
+    flag('duplicate_play', (same_as_previous & ~pd.Series(new_game)).to_numpy(), 'Same play as the previous row')
+
+    if not anomalies:
+        return pd.DataFrame(columns=['severity', 'check', 'Season', 'Game ID', 'Inning', 'Hitter ID', 'Pitcher ID', 'Exact Result', 'message', 'suggestion'])
+
+    report = pd.concat(anomalies, ignore_index=True)
+    report['severity'] = report['check'].map(CHECK_SEVERITY)
+    report['Season_num'] = report['Season'].str.replace('S', '').astype(int)
+    report.sort_values(by=['severity', 'Season_num', 'Game ID'], ascending=[False, True, True], kind='stable', inplace=True)
+    report['suggestion'] = [_suggest_correction(row) for row in report.to_dict('records')]
+    return report[['severity', 'check', 'Season', 'Game ID', 'Inning', 'Hitter ID', 'Pitcher ID', 'Exact Result', 'message', 'suggestion']].reset_index(drop=True)
+
+def save_anomaly_report(report, path=None):
+    """Writes the anomaly report as JSON records to data/gamelog_anomalies.json."""
+    if path is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(script_dir, '..', 'data', 'gamelog_anomalies.json')
+    records = json.loads(report.to_json(orient='records'))
+    with open(path, 'w') as f:
+        json.dump(records, f, indent=4)
+    return path
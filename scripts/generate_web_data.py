@@ -1,5 +1,8 @@
 from data_loader import load_all_seasons, load_player_types
 from gamelog_corrections import apply_gamelog_corrections
+from batch_aggregation import prepare_pitch_columns, prepare_swing_columns, get_split_reports, get_recency_reports, get_hitter_reports, get_team_reports
+from matchup_index import build_matchup_chunks, save_player_chunks, player_chunk
+from gamelog_validation import find_gamelog_anomalies, save_anomaly_report
 import pandas as pd
 import sys
 import json
@@ -323,6 +326,14 @@ def main():
     ).reset_index()
     print("Gamelog corrections applied.")
 
+    print("Checking gamelogs for anomalies...")
+    anomalies = find_gamelog_anomalies(combined_df)
+    anomaly_path = save_anomaly_report(anomalies)
+    if not anomalies.empty:
+        print(f"Found {len(anomalies)} gamelog anomalies:")
+        print(anomalies['check'].value_counts().to_string())
+    print(f"Anomaly report saved to {anomaly_path}")
+
     all_players = pd.concat([
         combined_df[['Hitter ID', 'Hitter', 'Season', 'Session', 'Batter Team']].rename(columns={'Hitter ID': 'Player ID', 'Hitter': 'Player Name', 'Batter Team': 'Team'})
         ,
@@ -392,12 +403,25 @@ def main():
     
     recent_pitchers_df = combined_df[combined_df['Season'].isin(seasons_to_check)]
     recent_pitcher_ids = recent_pitchers_df['Pitcher ID'].unique()
+    reported_df = combined_df[combined_df['Pitcher ID'].isin(recent_pitcher_ids)]
+
+    # Regular/Playoff and Home/Away splits and recency windows for every pitcher
+    # come out of grouped passes over the same sorted rows.
+    typed_df = prepare_pitch_columns(combined_df)
+    pitch_df = typed_df[typed_df['Pitcher ID'].isin(pd.to_numeric(recent_pitcher_ids))].reset_index(drop=True)
+    split_reports = get_split_reports(pitch_df)
+    recency_reports = get_recency_reports(pitch_df, most_recent_season)
 
-    for pitcher_id in recent_pitcher_ids:
+    for pitcher_id, pitcher_df in reported_df.groupby('Pitcher ID', sort=False):
         if pitcher_id <= 0: continue
-        pitcher_df = combined_df[combined_df['Pitcher ID'] == pitcher_id]
         report = get_scouting_report_data(pitcher_id, pitcher_df)
         if report:
+            splits = split_reports.get(int(pitcher_id))
+            if splits:
+                report['splits'] = splits
+            recency_windows = recency_reports.get(int(pitcher_id))
+            if recency_windows:
+                report['recency_windows'] = recency_windows
             scouting_reports[int(pitcher_id)] = report
     
     output_path = os.path.join(output_dir, 'scouting_reports.json')
@@ -405,6 +429,35 @@ def main():
         json.dump(scouting_reports, f)
     print(f"Scouting reports saved to {output_path}")
 
+    print("Generating hitter scouting reports...")
+    recent_hitter_ids = pd.to_numeric(recent_pitchers_df['Hitter ID']).unique()
+    swing_df = prepare_swing_columns(typed_df)
+    hitter_reports = get_hitter_reports(swing_df, [hid for hid in recent_hitter_ids if hid > 0])
+
+    # Sharded like the matchup index, so a player page only fetches its own block of IDs.
+    hitter_report_chunks = defaultdict(dict)
+    for hitter_id, report in hitter_reports.items():
+        hitter_report_chunks[str(player_chunk(hitter_id))][hitter_id] = report
+    hitter_report_dir = os.path.join(output_dir, 'hitter_reports')
+    save_player_chunks(hitter_report_chunks, hitter_report_dir)
+    print(f"Hitter scouting reports saved to {hitter_report_dir} ({len(hitter_report_chunks)} chunks)")
+
+    print("Building matchup index...")
+    matchup_chunks = build_matchup_chunks(swing_df)
+    matchup_dir = os.path.join(output_dir, 'matchups')
+    save_player_chunks(matchup_chunks, matchup_dir)
+    print(f"Matchup index saved to {matchup_dir} ({len(matchup_chunks)} chunks)")
+
+    print("Generating team pitching staff reports...")
+    with open(os.path.join(output_dir, 'team_history.json'), 'r') as f:
+        team_history = json.load(f)
+    team_reports = get_team_reports(typed_df, team_history)
+
+    output_path = os.path.join(output_dir, 'team_reports.json')
+    with open(output_path, 'w') as f:
+        json.dump(team_reports, f)
+    print(f"Team reports saved to {output_path}")
+
     print("Done!")
 
 if __name__ == "__main__":
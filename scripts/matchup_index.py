@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+import json
+import os
+import sys
+from bisect import bisect_left
+
+# Players are sharded into blocks of consecutive IDs, so a player page only fetches the
+# chunk holding its own ID. Keep in sync with PLAYER_CHUNK_SIZE in docs/app.js.
+PLAYER_CHUNK_SIZE = 100
+# Each matchup is stored twice: keyed by pitcher (hitters they pitched to) and keyed by
+# hitter (pitchers they batted against), so both directions are direct lookups.
+MATCHUP_ROLES = {
+    'pitchers': ('Pitcher ID', 'Hitter ID'),
+    'hitters': ('Hitter ID', 'Pitcher ID'),
+}
+
+def _nullable_ints(series):
+    return [int(v) if v == v else None for v in series.to_numpy()]
+
+def player_chunk(player_id):
+    """Returns the chunk number holding a player ID."""
+    return int(player_id) // PLAYER_CHUNK_SIZE
+
+def build_matchup_index(swing_df, player_col='Pitcher ID', opponent_col='Hitter ID'):
+    """
+    Builds a matchup index keyed by player_col from the typed swing columns.
+
+    The rows are sorted once by (player, opponent, game order) and stored CSR-style:
+    'player_offsets' points each player at its range of (player, opponent) pairs, and
+    'pair_offsets' points each pair at its range of rows in the play arrays. IDs are
+    sorted, so a lookup is two binary searches plus a slice of the matchup's rows.
+
+    Args:
+        swing_df (pd.DataFrame): Typed columns from prepare_swing_columns.
+        player_col (str): The ID column the index is keyed by.
+        opponent_col (str): The ID column of the other side of each matchup.
+
+    Returns:
+        dict: A JSON-serializable index for get_matchup_history.
+    """
+    df = swing_df.sort_values(by=[player_col, opponent_col, 'Season_num', 'Session', 'Game ID', 'row'], kind='stable')
+    player_ids = df[player_col].to_numpy()
+    opponent_ids = df[opponent_col].to_numpy()
+
+    new_pair = np.ones(len(df), dtype=bool)
+    new_pair[1:] = (player_ids[1:] != player_ids[:-1]) | (opponent_ids[1:] != opponent_ids[:-1])
+    pair_starts = np.flatnonzero(new_pair)
+    pair_players = player_ids[pair_starts]
+
+    new_player = np.ones(len(pair_starts), dtype=bool)
+    new_player[1:] = pair_players[1:] != pair_players[:-1]
+    player_starts = np.flatnonzero(new_player)
+
+    season_codes, seasons = pd.factorize(df['Season'])
+    result_codes, results = pd.factorize(df['Exact Result'])
+
+    return {
+        'player_ids': pair_players[player_starts].tolist(),
+        'player_offsets': np.append(player_starts, len(pair_starts)).tolist(),
+        'opponent_ids': opponent_ids[pair_starts].tolist(),
+        'pair_offsets': np.append(pair_starts, len(df)).tolist(),
+        'seasons': [str(season) for season in seasons],
+        'season': season_codes.tolist(),
+        'session': _nullable_ints(df['Session']),
+        'pitch': _nullable_ints(df['Pitch']),
+        'swing': _nullable_ints(df['Swing']),
+        'diff': _nullable_ints(df['Diff']),
+        'results': [str(result) for result in results],
+        'result': result_codes.tolist(),
+    }
+
+def build_matchup_chunks(swing_df):
+    """
+    Builds one matchup index per role and block of PLAYER_CHUNK_SIZE player IDs.
+
+    Temporary (non-positive) IDs have no player page, so they only appear as opponents.
+
+    Returns:
+        dict: {'<role>_<chunk>': index}, for save_player_chunks.
+    """
+    chunks = {}
+    for role, (player_col, opponent_col) in MATCHUP_ROLES.items():
+        keyed_df = swing_df[swing_df[player_col] > 0]
+        chunk_ids = keyed_df[player_col].to_numpy() // PLAYER_CHUNK_SIZE
+        for chunk, chunk_df in keyed_df.groupby(chunk_ids, sort=True):
+            chunks[f'{role}_{int(chunk)}'] = build_matchup_index(chunk_df, player_col, opponent_col)
+    return chunks
+
+def save_player_chunks(chunks, chunk_dir):
+    """Writes each chunk to <chunk_dir>/<name>.json, replacing any old chunks."""
+    os.makedirs(chunk_dir, exist_ok=True)
+    for file_name in os.listdir(chunk_dir):
+        if file_name.endswith('.json'):
+            os.remove(os.path.join(chunk_dir, file_name))
+    for name, chunk in chunks.items():
+        with open(os.path.join(chunk_dir, f'{name}.json'), 'w') as f:
+            f.write(json.dumps(chunk, separators=(',', ':')))
+
+def get_matchup_history(index, player_id, opponent_id):
+    """Returns every play between the index's player and an opponent, in game order. Empty if they never met."""
+    player_ids = index['player_ids']
+    i = bisect_left(player_ids, player_id)
+    if i == len(player_ids) or player_ids[i] != player_id:
+        return []
+
+    lo, hi = index['player_offsets'][i], index['player_offsets'][i + 1]
+    j = bisect_left(index['opponent_ids'], opponent_id, lo, hi)
+    if j == hi or index['opponent_ids'][j] != opponent_id:
+        return []
+
+    history = []
+    for k in range(index['pair_offsets'][j], index['pair_offsets'][j + 1]):
+        history.append({
+            'season': index['seasons'][index['season'][k]],
+            'session': index['session'][k],
+            'pitch': index['pitch'][k],
+            'swing': index['swing'][k],
+            'diff': index['diff'][k],
+            'result': index['results'][index['result'][k]] if index['result'][k] >= 0 else None
+        })
+    return history
+
+def load_matchup_chunk(role, player_id):
+    """Loads the matchup chunk holding player_id for a role ('pitchers' or 'hitters') from the web data directory."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    chunk_path = os.path.join(script_dir, '..', 'docs', 'data', 'matchups', f'{role}_{player_chunk(player_id)}.json')
+
+    if not os.path.exists(chunk_path):
+        print(f"Error: matchup chunk not found at {chunk_path}")
+        return None
+
+    with open(chunk_path, 'r') as f:
+        return json.load(f)
+
+if __name__ == '__main__':
+    # Example usage: python scripts/matchup_index.py <pitcher_id> <hitter_id>
+    if len(sys.argv) != 3:
+        print("Usage: python scripts/matchup_index.py <pitcher_id> <hitter_id>")
+        sys.exit(1)
+
+    pitcher_id = int(sys.argv[1])
+    index = load_matchup_chunk('pitchers', pitcher_id)
+    if index:
+        history = get_matchup_history(index, pitcher_id, int(sys.argv[2]))
+        if not history:
+            print("No plays found for this matchup.")
+        for play in history:
+            print(f"{play['season']}.{play['session']}: pitch {play['pitch']}, swing {play['swing']}, diff {play['diff']} -> {play['result']}")